@@ -53,10 +53,13 @@ class CLIManager:
             return
         filepath = input("Entrez le chemin de sauvegarde (ex: resultats_freq.txt) : ").strip()
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Grand tampon d'écriture + writelines : un seul appel Python pour toutes les lignes
+            with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 f.write("MOT,FRÉQUENCE\n")
-                for mot, count in self.freq_analyzer.get_top_n_in_corpus(len(self.freq_analyzer.corpus_freq)):
-                    f.write(f"{mot},{count}\n")
+                f.writelines(
+                    f"{mot},{count}\n"
+                    for mot, count in self.freq_analyzer.iter_sorted_corpus()
+                )
             print(f"Fréquences sauvegardées avec succès dans '{filepath}'.")
         except Exception as e:
             print(f"Erreur lors de la sauvegarde : {e}")
@@ -71,10 +74,8 @@ class CLIManager:
             # Construit l'index à partir des lignes chargées
             docs_lines = self.text_processor.get_lines()
             self.indexer.build_index(docs_lines)
-            # Analyse de fréquence
-            docs_tokens = self.text_processor.get_tokens()
-            self.freq_analyzer.compute_frequency_per_document(docs_tokens)
-            self.freq_analyzer.compute_corpus_frequency()
+            # Analyse de fréquence (seuls les documents (re)chargés sont recalculés)
+            self._update_frequencies()
             # Instanciation du retriever
             self.retriever = DocumentRetriever(
                 index=self.indexer.get_index(),
@@ -85,6 +86,18 @@ class CLIManager:
         except Exception as e:
             print(f"Erreur lors du chargement : {e}")
 
+    def _update_frequencies(self) -> bool:
+        """
+        Met à jour les fréquences des seuls documents modifiés depuis la dernière analyse.
+        Retourne True si au moins un document a été recalculé.
+        """
+        dirty = self.text_processor.get_dirty()
+        if not dirty:
+            return False
+        self.freq_analyzer.update_documents(self.text_processor.get_tokens(), dirty)
+        self.text_processor.clear_dirty()
+        return True
+
     def _handle_frequency_display(self) -> None:
         """
         Option 3 : afficher les N mots les plus fréquents.
@@ -138,16 +151,22 @@ class CLIManager:
         if not occurrences:
             print(f"Aucune occurrence de '{mot}' trouvée dans les documents.")
             return
+        all_lines = self.text_processor.get_lines()
+        # On accumule la sortie puis on l'écrit en un seul appel (au lieu d'un print par ligne)
+        sortie = []
         for filepath, lignes_idx in occurrences.items():
-            print(f"\n-- Document : {filepath} --")
-            lines = self.text_processor.get_lines()[filepath]
+            sortie.append(f"\n-- Document : {filepath} --")
+            lines = all_lines[filepath]
+            nlines = len(lines)
             for num in lignes_idx:
                 # Protection si le numéro de ligne est hors-limite
-                if 1 <= num <= len(lines):
-                    print(f"  Ligne {num} : {lines[num - 1]}")
+                if 1 <= num <= nlines:
+                    sortie.append(f"  Ligne {num} : {lines[num - 1]}")
                 else:
-                    print(f"  Ligne {num} : (numéro de ligne invalide)")
-        print("Recherche terminée.")
+                    sortie.append(f"  Ligne {num} : (numéro de ligne invalide)")
+        sortie.append("Recherche terminée.\n")
+        sys.stdout.write('\n'.join(sortie))
+        sys.stdout.flush()
 
     def _handle_retrieve_documents(self) -> None:
         """
@@ -177,10 +196,12 @@ class CLIManager:
             print("Aucun document trouvé pour ces mots-clés.")
             return
 
-        print("\nDocuments trouvés (chemin – score) :")
-        for filepath, score in résultats:
-            print(f"  {filepath}  – Score : {score}")
-        print("Recherche de documents terminée.")
+        # On accumule la sortie puis on l'écrit en un seul appel (au lieu d'un print par document)
+        sortie = ["\nDocuments trouvés (chemin – score) :"]
+        sortie.extend(f"  {filepath}  – Score : {score}" for filepath, score in résultats)
+        sortie.append("Recherche de documents terminée.\n")
+        sys.stdout.write('\n'.join(sortie))
+        sys.stdout.flush()
 
     def run(self) -> None:
         """
@@ -196,15 +217,13 @@ class CLIManager:
                 if not self.loaded:
                     print("Aucun document chargé. Choisissez l'option 1 d'abord.")
                 else:
-                    # On recalcule au cas où les documents auraient changé
-                    docs_tokens = self.text_processor.get_tokens()
-                    self.freq_analyzer.compute_frequency_per_document(docs_tokens)
-                    self.freq_analyzer.compute_corpus_frequency()
-                    # Mise à jour du retriever
-                    self.retriever = DocumentRetriever(
-                        index=self.indexer.get_index(),
-                        freq_per_doc=self.freq_analyzer.freq_per_doc
-                    )
+                    # On recalcule uniquement les documents qui ont changé ; le retriever
+                    # n'est reconstruit que dans ce cas
+                    if self._update_frequencies():
+                        self.retriever = DocumentRetriever(
+                            index=self.indexer.get_index(),
+                            freq_per_doc=self.freq_analyzer.freq_per_doc
+                        )
                     print("Analyse de fréquence effectuée avec succès.")
             elif choix == '3':
                 self._handle_frequency_display()
@@ -1,19 +1,29 @@
+from array import array
 from collections import Counter
 
 class DocumentRetriever:
     """
     Classe chargée de la recherche de documents sur base d'une requête de mots-clés.
-    - Utilise l'index inversé (de SimpleIndexer) pour localiser les documents concernés.
+    - Inverse une fois pour toutes les fréquences par document en listes mot -> [(document, fréquence)]
+      pour localiser les documents concernés et leur score sans double recherche.
     - Calcule un score de pertinence basique (nombre de mots-clés trouvés) et trie les résultats.
     """
 
-    def __init__(self, index: dict[str, dict[str, list[int]]], freq_per_doc: dict[str, Counter]):
+    def __init__(self, index: dict[str, dict[str, array]], freq_per_doc: dict[str, Counter]):
         """
-        :param index: index inversé (mot -> {fichier: [n°_lignes]})
+        :param index: index inversé (mot -> {fichier: array('i', [n°_lignes])}), conservé pour référence ;
+                      la recherche passe par term_to_docs, construit à partir de freq_per_doc
         :param freq_per_doc: fréquences par document (chemin_fichier -> Counter(mot:count))
         """
         self.index = index
         self.freq_per_doc = freq_per_doc
+        # Postings pondérés : {mot: [(chemin_fichier, fréquence), ...]}, triés par fréquence décroissante
+        self.term_to_docs: dict[str, list[tuple[str, int]]] = {}
+        for filepath, counter in freq_per_doc.items():
+            for mot, n in counter.items():
+                self.term_to_docs.setdefault(mot, []).append((filepath, n))
+        for postings in self.term_to_docs.values():
+            postings.sort(key=lambda pair: pair[1], reverse=True)
 
     def retrieve(self, keywords: list[str]) -> list[tuple[str, int]]:
         """
@@ -25,20 +35,17 @@ class DocumentRetriever:
         if not keywords:
             return []
 
-        # Pour chaque mot-clé, récupérer les documents où il apparaît
-        docs_with_keyword: dict[str, int] = {}
-        for kw in keywords:
-            mot = kw.lower()
-            if mot in self.index:
-                # Pour chaque doc contenant ce mot, augmenter le score
-                for filepath, _ in self.index[mot].items():
-                    freq = self.freq_per_doc.get(filepath, Counter()).get(mot, 0)
-                    docs_with_keyword.setdefault(filepath, 0)
-                    docs_with_keyword[filepath] += freq
+        # Mots-clés mis en minuscules une seule fois
+        kws = [kw.lower() for kw in keywords]
 
-        # Transformer en liste triée par score décroissant
-        résultats = sorted(docs_with_keyword.items(), key=lambda pair: pair[1], reverse=True)
-        return résultats
+        # Pour chaque mot-clé, parcourir une seule fois ses postings (document, fréquence)
+        scores: Counter = Counter()
+        for mot in kws:
+            for filepath, n in self.term_to_docs.get(mot, ()):
+                scores[filepath] += n
+
+        # Liste triée par score décroissant
+        return scores.most_common()
 
     def boolean_and_retrieve(self, keywords: list[str]) -> list[tuple[str, int]]:
         """
@@ -48,23 +55,25 @@ class DocumentRetriever:
         if not keywords:
             return []
 
-        # D'abord, pour chaque mot, récupérer l'ensemble des documents
-        sets_of_docs = []
-        for kw in keywords:
-            mot = kw.lower()
-            docs_for_mot = set(self.index.get(mot, {}).keys())
-            sets_of_docs.append(docs_for_mot)
+        # Mots-clés mis en minuscules une seule fois (et non plus pour chaque document)
+        kws = [kw.lower() for kw in keywords]
 
-        # Intersection des ensembles
-        docs_intersection = set.intersection(*sets_of_docs) if sets_of_docs else set()
+        # D'abord, pour chaque mot, récupérer les documents et leur fréquence : {chemin_fichier: fréquence}
+        freqs_for_kws = [dict(self.term_to_docs.get(mot, ())) for mot in kws]
+        sets_of_docs = [docs_for_mot.keys() for docs_for_mot in freqs_for_kws]
+
+        # Intersection des ensembles, en partant du plus petit : il devient l'ensemble candidat
+        # et chaque étape ne peut que le réduire (moins de sondages dans les ensembles suivants)
+        sets_of_docs.sort(key=len)
+        if not sets_of_docs[0]:
+            # Un mot-clé absent du corpus : aucun document ne peut les contenir tous
+            return []
+        docs_intersection = set(sets_of_docs[0]).intersection(*sets_of_docs[1:])
 
         # Pour ces documents, calculer le score identique
         résultats = []
         for filepath in docs_intersection:
-            score = 0
-            for kw in keywords:
-                mot = kw.lower()
-                score += self.freq_per_doc.get(filepath, Counter()).get(mot, 0)
+            score = sum(docs_for_mot[filepath] for docs_for_mot in freqs_for_kws)
             résultats.append((filepath, score))
 
         # Tri décroissant
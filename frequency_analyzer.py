@@ -1,4 +1,8 @@
+import heapq
+import sys
 from collections import Counter
+from collections.abc import Iterator
+from operator import itemgetter
 
 class FrequencyAnalyzer:
     """
@@ -8,7 +12,7 @@ class FrequencyAnalyzer:
     - Afficher les N mots les plus fréquents.
     """
 
-    def _init_(self):
+    def __init__(self):
         # Fréquences par document : {chemin_fichier: Counter({mot: count, ...}), ...}
         self.freq_per_doc: dict[str, Counter] = {}
         # Fréquence agrégée sur tous les documents : Counter({mot: count, ...})
@@ -29,10 +33,38 @@ class FrequencyAnalyzer:
         Agrège toutes les fréquences par document pour obtenir une fréquence globale.
         Nécessite d'avoir appelé compute_frequency_per_document au préalable.
         """
-        self.corpus_freq = Counter()
-        for counter in self.freq_per_doc.values():
+        if not self.freq_per_doc:
+            self.corpus_freq = Counter()
+            return
+        # On part d'une copie du plus grand Counter puis on y fusionne les autres :
+        # le dict global est dimensionné d'emblée au lieu de grossir document après document.
+        counters = sorted(self.freq_per_doc.values(), key=len, reverse=True)
+        self.corpus_freq = counters[0].copy()
+        for counter in counters[1:]:
             self.corpus_freq.update(counter)
 
+    def update_documents(self, docs_tokens: dict[str, list[str]], dirty: set[str]) -> None:
+        """
+        Mise à jour incrémentale : ne recalcule la fréquence que des documents de dirty
+        (nouveaux ou rechargés) et corrige la fréquence globale en conséquence
+        (retrait de l'ancien Counter du document, ajout du nouveau).
+        Équivalent à compute_frequency_per_document + compute_corpus_frequency,
+        en O(tokens modifiés) au lieu de O(tokens du corpus).
+        """
+        removed = False
+        # Parcours dans l'ordre de docs_tokens : les nouveaux documents gardent l'ordre de chargement
+        for filepath in (fp for fp in docs_tokens if fp in dirty):
+            old = self.freq_per_doc.get(filepath)
+            if old is not None:
+                self.corpus_freq.subtract(old)
+                removed = True
+            counter = Counter(docs_tokens[filepath])
+            self.freq_per_doc[filepath] = counter
+            self.corpus_freq.update(counter)
+        if removed:
+            # subtract() laisse des compteurs nuls pour les mots disparus : on les retire
+            self.corpus_freq = +self.corpus_freq
+
     def get_top_n_in_document(self, filepath: str, n: int) -> list[tuple[str, int]]:
         """
         Retourne les n mots les plus fréquents dans un document donné.
@@ -47,13 +79,22 @@ class FrequencyAnalyzer:
         Retourne les n mots les plus fréquents dans l'ensemble du corpus.
         Doit avoir appelé compute_corpus_frequency avant.
         """
-        return self.corpus_freq.most_common(n)
+        # Tas borné à n éléments : pas de tri complet du vocabulaire quand n est petit
+        return heapq.nlargest(n, self.corpus_freq.items(), key=itemgetter(1))
+
+    def iter_sorted_corpus(self) -> Iterator[tuple[str, int]]:
+        """
+        Parcourt tout le vocabulaire du corpus par fréquence décroissante (ex : pour une sauvegarde).
+        Un tri direct, plutôt que get_top_n_in_corpus(len(...)) qui passerait par le tas.
+        """
+        return iter(sorted(self.corpus_freq.items(), key=itemgetter(1), reverse=True))
 
     def display_top_n(self, freq_list: list[tuple[str, int]]) -> None:
         """
         Affiche à la console une liste de tuples (mot, fréquence).
+        Le tableau est construit en mémoire puis écrit en un seul appel (au lieu d'un print par ligne).
         """
-        print(f"{'Mot':<20} {'Fréquence':>10}")
-        print("-" * 32)
-        for mot, count in freq_list:
-            print(f"{mot:<20} {count:>10}")
\ No newline at end of file
+        sortie = [f"{'Mot':<20} {'Fréquence':>10}\n", "-" * 32 + "\n"]
+        sortie.extend(f"{mot:<20} {count:>10}\n" for mot, count in freq_list)
+        sys.stdout.write(''.join(sortie))
+        sys.stdout.flush()
\ No newline at end of file
@@ -1,4 +1,7 @@
-import re
+import sys
+from array import array
+from bisect import bisect_left
+from text_processor import tokenize
 
 class SimpleIndexer:
     """
@@ -8,42 +11,69 @@ class SimpleIndexer:
       et de lister les documents + lignes où il apparaît.
     """
 
-    def _init_(self):
-        # Index inversé : {mot: {chemin_fichier: [n°_ligne1, n°_ligne2, ...], ...}, ...}
-        self.index: dict[str, dict[str, list[int]]] = {}
+    def __init__(self):
+        # Index inversé : {mot: {chemin_fichier: array('i', [n°_ligne1, n°_ligne2, ...]), ...}, ...}
+        # Les n° de ligne sont stockés dans des array('i') (entiers 32 bits contigus) plutôt que
+        # des list[int] (un objet int par entrée) : l'index occupe nettement moins de mémoire.
+        self.index: dict[str, dict[str, array]] = {}
+        # Vocabulaire trié (clés de l'index) : permet la recherche par préfixe par dichotomie
+        self._vocab: list[str] = []
 
     def build_index(self, docs_lines: dict[str, list[str]]) -> None:
         """
         Construit l'index à partir des lignes brutes de chaque document.
         - Pour chaque document (chemin_fichier), parcourt chaque ligne (numéro de ligne et texte).
-        - Nettoie la ligne (minuscules, suppression ponctuation), tokenize, puis
-          pour chaque mot trouvé, ajoute au dictionnaire l'entrée (fichier, numéro de ligne).
+        - Tokenize la ligne en une seule passe (text_processor.tokenize : table de traduction
+          pour l'ASCII, expression régulière sinon), puis pour chaque mot trouvé,
+          ajoute au dictionnaire l'entrée (fichier, numéro de ligne).
+        - Un même numéro de ligne n'est enregistré qu'une fois par mot et par fichier.
         """
-        self.index = {}
+        index: dict[str, dict[str, array]] = {}
+        index_get = index.get
         for filepath, lines in docs_lines.items():
             for idx, raw_line in enumerate(lines, start=1):
-                # Nettoyage simple : minuscules + suppression ponctuation
-                line = raw_line.lower()
-                line_clean = re.sub(r'[^\w\s]', '', line)
-                tokens = line_clean.split()
-                for mot in tokens:
-                    if mot not in self.index:
-                        self.index[mot] = {}
-                    if filepath not in self.index[mot]:
-                        self.index[mot][filepath] = []
+                # Un set par ligne : chaque mot distinct de la ligne n'est traité qu'une fois
+                for mot in set(tokenize(raw_line)):
+                    docs = index_get(mot)
+                    if docs is None:
+                        # Nouveau mot : la clé est internée (partagée avec les tokens des documents)
+                        docs = index[sys.intern(mot)] = {}
+                    lignes = docs.get(filepath)
+                    if lignes is None:
+                        lignes = docs[filepath] = array('i')
                     # On ajoute le n° de ligne où le mot apparaît
-                    self.index[mot][filepath].append(idx)
+                    lignes.append(idx)
+        self.index = index
+        self._vocab = sorted(index)
 
-    def search_word(self, word: str) -> dict[str, list[int]]:
+    def search_word(self, word: str) -> dict[str, array]:
         """
         Recherche un mot (en ignorant la casse) dans l'index.
-        Retourne un dictionnaire {chemin_fichier: [n°_ligne1, n°_ligne2, ...], ...}.
+        Retourne un dictionnaire {chemin_fichier: array('i', [n°_ligne1, n°_ligne2, ...]), ...}.
         Si le mot n'existe pas dans l'index, retourne un dict vide.
         """
         mot = word.lower()
         return self.index.get(mot, {})
 
-    def get_index(self) -> dict[str, dict[str, list[int]]]:
+    def search_prefix(self, prefix: str) -> dict[str, dict[str, array]]:
+        """
+        Recherche tous les mots commençant par prefix (en ignorant la casse), ex : « info »
+        pour info, information, informatique...
+        Retourne un dictionnaire {mot: {chemin_fichier: array('i', [n°_ligne1, ...]), ...}, ...}
+        trié par ordre alphabétique. Si aucun mot ne correspond, retourne un dict vide.
+        """
+        debut = prefix.lower()
+        vocab = self._vocab
+        résultats = {}
+        # Les mots ayant ce préfixe sont contigus dans le vocabulaire trié
+        for i in range(bisect_left(vocab, debut), len(vocab)):
+            mot = vocab[i]
+            if not mot.startswith(debut):
+                break
+            résultats[mot] = self.index[mot]
+        return résultats
+
+    def get_index(self) -> dict[str, dict[str, array]]:
         """
         Retourne l'index inversé complet.
         """
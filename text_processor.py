@@ -1,5 +1,33 @@
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Un mot = suite de lettres/chiffres (la ponctuation et « _ » servent de séparateurs)
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+# Chemin rapide pour les textes ASCII : une seule table de traduction qui met les majuscules
+# en minuscules et remplace tout caractère non alphanumérique par un espace.
+# Même découpage que _TOKEN_RE, sans passer par le moteur d'expressions régulières.
+_ASCII_TABLE = str.maketrans({
+    c: (c.lower() if c.isalnum() else ' ')
+    for c in map(chr, range(128))
+    if c.isupper() or not c.isalnum()
+})
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Découpe un texte en mots en minuscules (suites de lettres/chiffres).
+    Un texte purement ASCII est traité par str.translate + split (une seule passe linéaire
+    en C sur la table _ASCII_TABLE), les autres par l'expression régulière _TOKEN_RE.
+    Partagé par TextProcessor et SimpleIndexer pour que fréquences et index utilisent
+    exactement la même définition d'un mot.
+    """
+    if text.isascii():
+        return text.translate(_ASCII_TABLE).split()
+    return _TOKEN_RE.findall(text.lower())
+
 
 class TextProcessor:
     """
@@ -17,6 +45,8 @@ class TextProcessor:
         self.docs_tokens = {}
         # Docs lines : {chemin_fichier: [liste_de_lignes_brutes]}
         self.docs_lines = {}
+        # Docs modifiés : chemins (re)chargés depuis la dernière analyse de fréquence
+        self._dirty: set[str] = set()
 
     def _is_text_file(self, filename: str) -> bool:
         """
@@ -34,42 +64,55 @@ class TextProcessor:
         except Exception as e:
             raise IOError(f"Impossible de lire le fichier {filepath} : {e}")
 
-    def _read_lines(self, filepath: str) -> list[str]:
+    def _split_lines(self, raw: str) -> list[str]:
         """
-        Lit toutes les lignes brutes d'un fichier texte (sans transformation).
+        Découpe un texte déjà lu en lignes brutes (sans le caractère de fin de ligne),
+        avec le même résultat que readlines() sur le fichier, sans le relire.
         """
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.readlines()
-        except Exception as e:
-            raise IOError(f"Impossible de lire les lignes du fichier {filepath} : {e}")
+        lignes = raw.split('\n')
+        # Le morceau après le dernier '\n' (ou un fichier vide) n'est pas une ligne
+        if lignes[-1] == '':
+            lignes.pop()
+        return lignes
 
     def _clean_and_tokenize(self, text: str) -> list[str]:
         """
         Nettoie un texte :
         - Passage en minuscules.
-        - Suppression de la ponctuation de base (tout caractère non alphanumérique ou espace).
-        - Séparation en mots (split sur les espaces).
+        - Extraction des mots (suites de lettres/chiffres), la ponctuation et les espaces
+          servant de séparateurs.
+        (voir tokenize)
+        Les mots sont internés (sys.intern) : un même mot n'existe qu'en un seul exemplaire en
+        mémoire pour tout le corpus, et les recherches dans les dict/Counter comparent des pointeurs.
         Retourne la liste de mots nettoyés.
         """
-        # Convertir en minuscules
-        text = text.lower()
-        # Supprimer toute ponctuation de base (garde lettres, chiffres et espaces)
-        text = re.sub(r'[^\w\s]', '', text)
-        # Découper sur les espaces
-        tokens = text.split()
-        # Filtrer les éventuels tokens vides
-        return [tok for tok in tokens if tok]
+        return list(map(sys.intern, tokenize(text)))
 
-    def process_documents(self, paths: list[str]) -> None:
+    def _load_one(self, filepath: str) -> tuple[str, str, list[str], list[str]]:
+        """
+        Lit et prétraite un seul fichier (indépendant des autres, exécutable en parallèle).
+        Retourne (chemin_fichier, texte_brut, lignes_brutes, tokens).
+        """
+        # Lecture du texte brut (une seule lecture du fichier)
+        raw = self._read_file(filepath)
+        # Lignes brutes (pour recherche contextuelle), dérivées du texte déjà lu
+        lignes = self._split_lines(raw)
+        # Tokenisation de l'intégralité du texte
+        tokens = self._clean_and_tokenize(raw)
+        return filepath, raw, lignes, tokens
+
+    def process_documents(self, paths: list[str], max_workers: int | None = None) -> None:
         """
         Charge un ou plusieurs fichiers ou dossiers pointés dans paths (liste de chemins).
         - Si un élément de paths est un fichier .txt, on le lit.
         - Si c'est un dossier, on parcourt récursivement ce dossier et on lit tous les .txt qu'on y trouve.
+        Les fichiers sont lus en parallèle (max_workers threads, valeur par défaut de
+        ThreadPoolExecutor si None), les résultats étant fusionnés dans l'ordre des chemins.
         Remplit :
           self.docs_raw    : {chemin_fichier: texte_brut}
           self.docs_lines  : {chemin_fichier: [lignes_brutes]}
           self.docs_tokens : {chemin_fichier: [liste_de_mots_nettoyés]}
+        Chaque fichier chargé est marqué comme modifié (voir get_dirty).
         """
         to_process = []
         for p in paths:
@@ -84,18 +127,13 @@ class TextProcessor:
             else:
                 raise FileNotFoundError(f"Le chemin '{p}' n'existe pas ou n'est pas un fichier .txt")
 
-        for filepath in to_process:
-            # Lecture du texte brut
-            raw = self._read_file(filepath)
-            self.docs_raw[filepath] = raw
-
-            # Lecture des lignes brutes (pour recherche contextuelle)
-            lignes = self._read_lines(filepath)
-            self.docs_lines[filepath] = [l.strip('\n') for l in lignes]
-
-            # Tokenisation de l'intégralité du texte
-            tokens = self._clean_and_tokenize(raw)
-            self.docs_tokens[filepath] = tokens
+        # map() conserve l'ordre de to_process et relance l'éventuelle IOError d'un fichier
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for filepath, raw, lignes, tokens in executor.map(self._load_one, to_process):
+                self.docs_raw[filepath] = raw
+                self.docs_lines[filepath] = lignes
+                self.docs_tokens[filepath] = tokens
+                self._dirty.add(filepath)
 
     def get_raw(self) -> dict[str, str]:
         """
@@ -113,4 +151,16 @@ class TextProcessor:
         """
         Retourne le dictionnaire des lignes brutes par document (chemin -> liste de lignes).
         """
-        return self.docs_lines
\ No newline at end of file
+        return self.docs_lines
+
+    def get_dirty(self) -> set[str]:
+        """
+        Retourne l'ensemble des chemins (re)chargés depuis le dernier clear_dirty().
+        """
+        return self._dirty
+
+    def clear_dirty(self) -> None:
+        """
+        Marque tous les documents chargés comme à jour (à appeler une fois leur analyse faite).
+        """
+        self._dirty = set()
\ No newline at end of file